@@ -22,6 +22,7 @@ Use the subclasses directly for custom transformations:
 
 import warnings
 from collections.abc import Iterable
+from contextlib import suppress
 from copy import deepcopy
 from inspect import signature
 from typing import Any
@@ -116,6 +117,28 @@ class Transformation:
     function: Any
     lookup_name: str
 
+    _function: Any = None
+    _function_parameters: tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Store the parameter names of the function once per subclass."""
+        super().__init_subclass__(**kwargs)
+
+        if hasattr(cls, "function"):
+            # Unsupported functions raise when the class is instantiated instead.
+            with suppress(TypeError, ValueError):
+                cls._get_function_parameters()
+
+    @classmethod
+    def _get_function_parameters(cls) -> tuple[str, ...]:
+        """Parameter names of the class function, recomputed if it was reassigned."""
+        function = cls.function
+        if function is not cls._function:
+            cls._function_parameters = tuple(signature(function).parameters)
+            cls._function = function
+
+        return cls._function_parameters
+
     def __init__(
         self, priors: dict[str, Prior] | None = None, prefix: str | None = None
     ) -> None:
@@ -263,12 +286,12 @@ class Transformation:
             raise NotImplementedError("lookup_name must be implemented in the subclass")
 
     def _has_defaults_for_all_arguments(self) -> None:
-        function_signature = signature(self.function)
+        function_parameters = self._get_function_parameters()
+        if function_parameters[0] == "self":
+            function_parameters = function_parameters[1:]
 
         # Remove the first one as assumed to be the data
-        parameters_that_need_priors = set(
-            list(function_signature.parameters.keys())[1:]
-        )
+        parameters_that_need_priors = set(function_parameters[1:])
         parameters_with_priors = set(self.default_priors.keys())
 
         missing_priors = parameters_that_need_priors - parameters_with_priors
@@ -279,7 +302,7 @@ class Transformation:
 
     def _function_works_on_instances(self) -> None:
         class_function = self.__class__.function
-        function_parameters = list(signature(class_function).parameters)
+        function_parameters = self._get_function_parameters()
 
         is_method = function_parameters[0] == "self"
         data_parameter_idx = 1 if is_method else 0
@@ -248,10 +248,10 @@ def generate_fourier_modes(
         Fourier modes.
 
     """
-    multiples = pt.arange(1, n_order + 1)
-    x = 2 * pt.pi * periods
-
-    values = x[:, None] * multiples
+    # The angular frequencies are constant, so 2 * pi is folded into them
+    # once instead of scaling every period before the outer product.
+    frequencies = 2 * np.pi * np.arange(1, n_order + 1)
+    values = pt.as_tensor_variable(periods)[:, None] * frequencies
 
     return pt.concatenate(
         [
@@ -177,7 +177,7 @@ def selections(
     """
     coord_names = coords.keys()
     for values in product(*coords.values()):
-        yield {name: value for name, value in zip(coord_names, values, strict=True)}
+        yield dict(zip(coord_names, values, strict=True))
 
 
 P = ParamSpec("P")
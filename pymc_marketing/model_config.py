@@ -31,6 +31,7 @@ def parse_model_config(
     model_config: ModelConfig,
     hsgp_kwargs_fields: list[str] | None = None,
     non_distributions: list[str] | None = None,
+    fail_fast: bool = False,
 ) -> ModelConfig:
     """Parse the model config dictionary.
 
@@ -43,6 +44,9 @@ def parse_model_config(
     non_distributions : list[str], optional
         A list of keys to ignore when parsing the model configuration
         dictionary due to them not being distributions.
+    fail_fast : bool, optional
+        Stop parsing at the first invalid entry instead of collecting the
+        errors of all entries. Default is False.
 
     Returns
     -------
@@ -112,51 +116,45 @@ def parse_model_config(
             print(e)
 
     """
-    non_distributions = non_distributions or []
-    hsgp_kwargs_fields = hsgp_kwargs_fields or []
-
-    parse_errors = []
-
-    def handle_prior_config(name, prior_config):
-        if name in non_distributions or name in hsgp_kwargs_fields:
-            return prior_config
-
-        if isinstance(prior_config, Prior):
-            return prior_config
-
-        try:
-            dist = Prior.from_json(prior_config)
-        except Exception as e:
-            parse_errors.append(f"Parameter {name}: {e}")
-        else:
-            msg = (
-                f"{name} is automatically converted to {dist}. "
-                "Use the Prior class to avoid this warning."
-            )
-            warnings.warn(msg, DeprecationWarning, stacklevel=2)
-
-            return dist
-
-    def handle_hggp_kwargs(name, config):
-        if name not in hsgp_kwargs_fields:
-            return config
-
-        if isinstance(config, HSGPKwargs):
-            return config
+    non_distributions_set = set(non_distributions or [])
+    hsgp_kwargs_fields_set = set(hsgp_kwargs_fields or [])
+
+    parse_errors: list[str] = []
+    result: ModelConfig = {}
+    for name, config in model_config.items():
+        # Parse the model configuration to extract the `HSGPKwargs` objects.
+        if name in hsgp_kwargs_fields_set:
+            if isinstance(config, HSGPKwargs):
+                result[name] = config
+                continue
+
+            try:
+                result[name] = HSGPKwargs.model_validate(config)
+            except Exception as e:
+                parse_errors.append(f"Parameter {name}: {e}")
+                if fail_fast:
+                    break
+            continue
+
+        # Parse the model configuration to extract the `Prior` objects.
+        if name in non_distributions_set or isinstance(config, Prior):
+            result[name] = config
+            continue
 
         try:
-            hsgp_kwargs = HSGPKwargs.model_validate(config)
-            return hsgp_kwargs
+            dist = Prior.from_json(config)
         except Exception as e:
             parse_errors.append(f"Parameter {name}: {e}")
+            if fail_fast:
+                break
+            continue
 
-    # Parse the model configuration to extrat the `Prior` objects.
-    result: ModelConfig = {
-        name: handle_prior_config(name, prior_config)
-        for name, prior_config in model_config.items()
-    }
-    # Parse the model configuration to extract the `HSGPKwargs` objects.
-    result = {name: handle_hggp_kwargs(name, config) for name, config in result.items()}
+        msg = (
+            f"{name} is automatically converted to {dist}. "
+            "Use the Prior class to avoid this warning."
+        )
+        warnings.warn(msg, DeprecationWarning, stacklevel=2)
+        result[name] = dist
 
     if parse_errors:
         combined_errors = ", ".join(parse_errors)
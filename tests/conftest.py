@@ -19,7 +19,7 @@ import pandas as pd
 import pymc as pm
 import pytest
 from arviz import InferenceData
-from xarray import DataArray, Dataset
+from xarray import Dataset
 
 from pymc_marketing.clv.models import BetaGeoModel, CLVModel, ParetoNBDModel
 from pymc_marketing.prior import Prior
@@ -58,9 +58,11 @@ def pytest_collection_modifyitems(config, items):
                 item.add_marker(skip_slow)
 
 
-@pytest.fixture(scope="module")
-def cdnow_trans() -> pd.DataFrame:
-    """Load CDNOW_sample transaction data into a Pandas dataframe.
+@pytest.fixture(scope="session")
+def cdnow_trans_session() -> pd.DataFrame:
+    """Load CDNOW_sample transaction data once per test session.
+
+    Shared by every module, so it must not be mutated. Use `cdnow_trans` instead.
 
     Data source: https://www.brucehardie.com/datasets/
     """
@@ -68,13 +70,31 @@ def cdnow_trans() -> pd.DataFrame:
 
 
 @pytest.fixture(scope="module")
-def test_summary_data() -> pd.DataFrame:
+def cdnow_trans(cdnow_trans_session) -> pd.DataFrame:
+    """Load CDNOW_sample transaction data into a Pandas dataframe.
+
+    Data source: https://www.brucehardie.com/datasets/
+    """
+    return cdnow_trans_session.copy()
+
+
+@pytest.fixture(scope="session")
+def test_summary_data_session() -> pd.DataFrame:
+    """Load the CLV summary data once per test session.
+
+    Shared by every module, so it must not be mutated. Use `test_summary_data` instead.
+    """
     df = pd.read_csv("data/clv_quickstart.csv")
     df["customer_id"] = df.index
     df["future_spend"] = df["monetary_value"]
     return df
 
 
+@pytest.fixture(scope="module")
+def test_summary_data(test_summary_data_session) -> pd.DataFrame:
+    return test_summary_data_session.copy()
+
+
 def set_model_fit(model: CLVModel, fit: InferenceData | Dataset):
     if isinstance(fit, InferenceData):
         assert "posterior" in fit.groups()
@@ -108,12 +128,15 @@ def create_mock_fit(params: dict[str, float]):
 
     """
 
+    values = np.fromiter(params.values(), dtype=float, count=len(params))
+
     def mock_fit(model, chains, draws, rng):
+        # Draw all parameters at once; the values match drawing them one by one
+        samples = rng.normal(
+            values[:, None, None], 1e-3, size=(len(values), chains, draws)
+        )
         model.idata = az.from_dict(
-            {
-                param: rng.normal(value, 1e-3, size=(chains, draws))
-                for param, value in params.items()
-            }
+            {param: samples[i] for i, param in enumerate(params)}
         )
         set_idata(model)
 
@@ -132,14 +155,11 @@ def mock_sample(*args, **kwargs):
         samples=samples,
     )
 
-    expanded_chains = DataArray(
-        np.ones(n_chains),
-        coords={"chain": np.arange(n_chains)},
-    )
+    # Broadcast the prior draws over the chains without materializing copies
     idata.add_groups(
-        posterior=(idata.prior.mean("chain") * expanded_chains).transpose(
-            "chain", "draw", ...
-        )
+        posterior=idata.prior.mean("chain")
+        .expand_dims(chain=np.arange(n_chains))
+        .transpose("chain", "draw", ...)
     )
     del idata.prior
     if "prior_predictive" in idata:
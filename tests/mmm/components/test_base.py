@@ -138,7 +138,49 @@ def test_new_transformation_missing_parameter() -> None:
         NewTransformation()
 
 
-@pytest.fixture
+def test_new_transformation_function_reassigned() -> None:
+    class NewTransformation(Transformation):
+        prefix = "new"
+        lookup_name: str = "new_transformation"
+        default_priors = {"b": "dummy"}
+        function = lambda x, a: a * x  # noqa: E731
+
+    with pytest.raises(ParameterPriorException, match="Missing default prior"):
+        NewTransformation()
+
+    NewTransformation.function = lambda x, b: b * x
+
+    new_transformation = NewTransformation()
+
+    x = np.array([1, 2, 3])
+    np.testing.assert_allclose(new_transformation.function(x, 2), 2 * x)
+
+
+def test_new_transformation_inherited_function() -> None:
+    class NewTransformation(Transformation):
+        prefix = "new"
+        lookup_name: str = "new_transformation"
+        default_priors = {"a": "dummy"}
+
+        def function(self, x, a):
+            return a * x
+
+    class ChildTransformation(NewTransformation):
+        lookup_name: str = "child_transformation"
+
+    class MissingPriorTransformation(NewTransformation):
+        default_priors = {"b": "dummy"}
+
+    child_transformation = ChildTransformation()
+
+    x = np.array([1, 2, 3])
+    np.testing.assert_allclose(child_transformation.function(x, 2), 2 * x)
+
+    with pytest.raises(ParameterPriorException, match="Missing default prior"):
+        MissingPriorTransformation()
+
+
+@pytest.fixture(scope="module")
 def new_transformation_class() -> type[Transformation]:
     class NewTransformation(Transformation):
         prefix = "new"
@@ -39,6 +39,33 @@ from pymc_marketing.mmm.transformers import (
 )
 
 
+def _read_only(array: np.ndarray) -> np.ndarray:
+    array.flags.writeable = False
+    return array
+
+
+# Inputs shared by the parametrized cases. They are read-only so that no
+# test can modify the arrays seen by the others.
+ONES_100 = _read_only(np.ones(shape=(100)))
+ZEROS_100 = _read_only(np.zeros(shape=(100)))
+LINSPACE_0_1_50 = _read_only(np.linspace(start=0.0, stop=1.0, num=50))
+LINSPACE_0_10_50 = _read_only(np.linspace(start=0.0, stop=10.0, num=50))
+LINSPACE_0_100_50 = _read_only(np.linspace(start=0.0, stop=100.0, num=50))
+
+
+@pytest.fixture(scope="module", autouse=True)
+def fast_compile_mode():
+    """Skip the graph rewrites of the default mode; the graphs here are small."""
+    with pytensor.config.change_flags(mode="FAST_COMPILE"):
+        yield
+
+
+def numpy_geometric_adstock(x, alpha, l_max):
+    """NumPy reference of geometric_adstock with the default ConvMode.After."""
+    w = alpha ** np.arange(l_max)
+    return np.convolve(x, w)[: len(x)]
+
+
 @pytest.fixture
 def dummy_design_matrix():
     return np.concatenate(
@@ -77,6 +104,48 @@ def convolution_axis(request):
     return request.param
 
 
+@pytest.fixture(scope="module")
+def compiled_geometric_adstock():
+    """Compile geometric_adstock once per l_max and reuse it across test cases."""
+    compiled = {}
+
+    def get_function(l_max):
+        if l_max not in compiled:
+            x = pt.dvector("x")
+            # alpha is shared rather than an input so that the convolution
+            # weights keep a shape that can be evaluated at graph build time.
+            alpha = pytensor.shared(0.0, name="alpha")
+            fn = pytensor.function(
+                [x], geometric_adstock(x=x, alpha=alpha, l_max=l_max)
+            )
+
+            def evaluate(x_val, alpha_val, fn=fn, alpha=alpha):
+                alpha.set_value(float(alpha_val))
+                return fn(x_val)
+
+            compiled[l_max] = evaluate
+        return compiled[l_max]
+
+    return get_function
+
+
+@pytest.fixture(scope="module")
+def compiled_logistic_saturation():
+    x = pt.dvector("x")
+    lam = pt.dscalar("lam")
+    return pytensor.function([x, lam], logistic_saturation(x=x, lam=lam))
+
+
+@pytest.fixture(scope="module")
+def compiled_tanh_saturation_inverse():
+    x = pt.dvector("x")
+    b = pt.dscalar("b")
+    c = pt.dscalar("c")
+    y = tanh_saturation(x=x, b=b, c=c)
+    y_inv = (b * c) * pt.arctanh(y / b)
+    return pytensor.function([x, b, c], y_inv)
+
+
 @pytest.mark.parametrize("mode", [ConvMode.After, ConvMode.Before, ConvMode.Overlap])
 def test_batched_convolution(convolution_inputs, convolution_axis, mode):
     x, w, x_val, w_val = convolution_inputs
@@ -134,20 +203,22 @@ class TestsAdstockTransformers:
     @pytest.mark.parametrize(
         "x, alpha, l_max",
         [
-            (np.ones(shape=(100)), 0.3, 10),
-            (np.ones(shape=(100)), 0.7, 100),
-            (np.zeros(shape=(100)), 0.2, 5),
-            (np.ones(shape=(100)), 0.5, 7),
-            (np.linspace(start=0.0, stop=1.0, num=50), 0.8, 3),
-            (np.linspace(start=0.0, stop=1.0, num=50), 0.8, 50),
+            (ONES_100, 0.3, 10),
+            (ONES_100, 0.7, 100),
+            (ZEROS_100, 0.2, 5),
+            (ONES_100, 0.5, 7),
+            (LINSPACE_0_1_50, 0.8, 3),
+            (LINSPACE_0_1_50, 0.8, 50),
         ],
     )
-    def test_geometric_adstock_good_alpha(self, x, alpha, l_max):
-        y = geometric_adstock(x=x, alpha=alpha, l_max=l_max)
-        y_np = y.eval()
+    def test_geometric_adstock_good_alpha(
+        self, compiled_geometric_adstock, x, alpha, l_max
+    ):
+        y_np = compiled_geometric_adstock(l_max)(x, alpha)
         assert y_np[0] == x[0]
         assert y_np[1] == x[1] + alpha * x[0]
         assert y_np[2] == x[2] + alpha * x[1] + (alpha**2) * x[0]
+        np.testing.assert_allclose(y_np, numpy_geometric_adstock(x, alpha, l_max))
 
     @pytest.mark.parametrize(
         "alpha",
@@ -159,12 +230,11 @@ class TestsAdstockTransformers:
             "greater_than_one_1",
         ],
     )
-    def test_geometric_adstock_bad_alpha(self, alpha):
+    def test_geometric_adstock_bad_alpha(self, compiled_geometric_adstock, alpha):
         l_max = 10
         x = np.ones(shape=100)
-        y = geometric_adstock(x=x, alpha=alpha, l_max=l_max)
         with pytest.raises(ParameterValueError):
-            y.eval()
+            compiled_geometric_adstock(l_max)(x, alpha)
 
     @pytest.mark.parametrize(
         argnames="mode",
@@ -240,13 +310,13 @@ class TestsAdstockTransformers:
     @pytest.mark.parametrize(
         "x, lam, k, l_max",
         [
-            (np.zeros(shape=(100)), 1, 1, 4),
-            (np.ones(shape=(100)), 0.3, 0.5, 10),
-            (np.ones(shape=(100)), 0.7, 1, 100),
-            (np.zeros(shape=(100)), 0.2, 0.2, 5),
-            (np.ones(shape=(100)), 0.5, 0.8, 7),
-            (np.linspace(start=0.0, stop=1.0, num=50), 0.8, 1.5, 3),
-            (np.linspace(start=0.0, stop=1.0, num=50), 0.8, 1, 50),
+            (ZEROS_100, 1, 1, 4),
+            (ONES_100, 0.3, 0.5, 10),
+            (ONES_100, 0.7, 1, 100),
+            (ZEROS_100, 0.2, 0.2, 5),
+            (ONES_100, 0.5, 0.8, 7),
+            (LINSPACE_0_1_50, 0.8, 1.5, 3),
+            (LINSPACE_0_1_50, 0.8, 1, 50),
         ],
     )
     def test_weibull_pdf_adstock(self, x, lam, k, l_max):
@@ -262,13 +332,13 @@ class TestsAdstockTransformers:
     @pytest.mark.parametrize(
         "x, lam, k, l_max",
         [
-            (np.zeros(shape=(100)), 1, 1, 4),
-            (np.ones(shape=(100)), 0.3, 0.5, 10),
-            (np.ones(shape=(100)), 0.7, 1, 100),
-            (np.zeros(shape=(100)), 0.2, 0.2, 5),
-            (np.ones(shape=(100)), 0.5, 0.8, 7),
-            (np.linspace(start=0.0, stop=1.0, num=50), 0.8, 1.5, 3),
-            (np.linspace(start=0.0, stop=1.0, num=50), 0.8, 1, 50),
+            (ZEROS_100, 1, 1, 4),
+            (ONES_100, 0.3, 0.5, 10),
+            (ONES_100, 0.7, 1, 100),
+            (ZEROS_100, 0.2, 0.2, 5),
+            (ONES_100, 0.5, 0.8, 7),
+            (LINSPACE_0_1_50, 0.8, 1.5, 3),
+            (LINSPACE_0_1_50, 0.8, 1, 50),
         ],
     )
     def test_weibull_cdf_adsotck(self, x, lam, k, l_max):
@@ -339,27 +409,28 @@ class TestSaturationTransformers:
     @pytest.mark.parametrize(
         "x",
         [
-            np.ones(shape=(100)),
-            np.linspace(start=0.0, stop=1.0, num=50),
+            ONES_100,
+            LINSPACE_0_1_50,
             np.linspace(start=200, stop=1000, num=50),
         ],
     )
-    def test_logistic_saturation_lam_large(self, x):
-        y = logistic_saturation(x=x, lam=1e6)
-        assert abs(y.eval()).mean() == pytest.approx(1.0, 1e-1)
+    def test_logistic_saturation_lam_large(self, compiled_logistic_saturation, x):
+        y = compiled_logistic_saturation(x, 1e6)
+        assert abs(y).mean() == pytest.approx(1.0, 1e-1)
 
     @pytest.mark.parametrize(
         "x, lam",
         [
-            (np.ones(shape=(100)), 30),
-            (np.linspace(start=0.0, stop=1.0, num=50), 90),
+            (ONES_100, 30),
+            (LINSPACE_0_1_50, 90),
             (np.linspace(start=200, stop=1000, num=50), 17),
-            (np.zeros(shape=(100)), 200),
+            (ZEROS_100, 200),
         ],
     )
-    def test_logistic_saturation_min_max_value(self, x, lam):
-        y = logistic_saturation(x=x, lam=lam)
-        y_eval = y.eval()
+    def test_logistic_saturation_min_max_value(
+        self, compiled_logistic_saturation, x, lam
+    ):
+        y_eval = compiled_logistic_saturation(x, lam)
         assert y_eval.max() <= 1
         assert y_eval.min() >= 0
 
@@ -386,55 +457,56 @@ class TestSaturationTransformers:
     @pytest.mark.parametrize(
         "x, b, c",
         [
-            (np.ones(shape=(100)), 0.5, 1.0),
-            (np.zeros(shape=(100)), 0.6, 5.0),
-            (np.linspace(start=0.0, stop=100.0, num=50), 0.001, 0.01),
+            (ONES_100, 0.5, 1.0),
+            (ZEROS_100, 0.6, 5.0),
+            (LINSPACE_0_100_50, 0.001, 0.01),
             (np.linspace(start=-2.0, stop=1.0, num=50), 0.1, 0.01),
             (np.linspace(start=-80.0, stop=1.0, num=50), 1, 1),
         ],
     )
     def test_tanh_saturation_range(self, x, b, c):
-        assert tanh_saturation(x=x, b=b, c=c).eval().max() <= b
-        assert tanh_saturation(x=x, b=b, c=c).eval().min() >= -b
+        y = tanh_saturation(x=x, b=b, c=c).eval()
+        assert y.max() <= b
+        assert y.min() >= -b
 
     @pytest.mark.parametrize(
         "x, b, c",
         [
-            (np.ones(shape=(100)), 0.5, 1.0),
-            (np.zeros(shape=(100)), 0.6, 5.0),
-            (np.linspace(start=0.0, stop=1.0, num=50), 1, 1),
+            (ONES_100, 0.5, 1.0),
+            (ZEROS_100, 0.6, 5.0),
+            (LINSPACE_0_1_50, 1, 1),
             (np.linspace(start=-2.0, stop=1.0, num=50), 1, 2),
             (np.linspace(start=-1.0, stop=1.0, num=50), 1, 2),
         ],
     )
-    def test_tanh_saturation_inverse(self, x, b, c):
-        y = tanh_saturation(x=x, b=b, c=c)
-        y_inv = (b * c) * pt.arctanh(y / b)
-        np.testing.assert_array_almost_equal(x=x, y=y_inv.eval(), decimal=6)
+    def test_tanh_saturation_inverse(self, compiled_tanh_saturation_inverse, x, b, c):
+        y_inv = compiled_tanh_saturation_inverse(x, b, c)
+        np.testing.assert_array_almost_equal(x=x, y=y_inv, decimal=6)
 
     @pytest.mark.parametrize(
         "x, x0, gain, r",
         [
-            (np.ones(shape=(100)), 10, 0.5, 0.5),
-            (np.zeros(shape=(100)), 10, 0.6, 0.3),
-            (np.linspace(start=0.0, stop=100.0, num=50), 10, 0.001, 0.01),
-            (np.linspace(start=0.0, stop=100.0, num=50), 10, 0.1, 0.01),
-            (np.linspace(start=0.0, stop=100.0, num=50), 10, 1, 0.25),
+            (ONES_100, 10, 0.5, 0.5),
+            (ZEROS_100, 10, 0.6, 0.3),
+            (LINSPACE_0_100_50, 10, 0.001, 0.01),
+            (LINSPACE_0_100_50, 10, 0.1, 0.01),
+            (LINSPACE_0_100_50, 10, 1, 0.25),
         ],
     )
     def test_tanh_saturation_baselined_range(self, x, x0, gain, r):
         b = (gain * x0) / r
-        assert tanh_saturation_baselined(x=x, x0=x0, gain=gain, r=r).eval().max() <= b
-        assert tanh_saturation_baselined(x=x, x0=x0, gain=gain, r=r).eval().min() >= -b
+        y = tanh_saturation_baselined(x=x, x0=x0, gain=gain, r=r).eval()
+        assert y.max() <= b
+        assert y.min() >= -b
 
     @pytest.mark.parametrize(
         "x, x0, gain, r",
         [
-            (np.ones(shape=(100)), 10, 0.5, 0.5),
-            (np.zeros(shape=(100)), 10, 0.6, 0.3),
-            (np.linspace(start=0.0, stop=100.0, num=50), 10, 0.001, 0.1),
-            (np.linspace(start=0.0, stop=100.0, num=50), 10, 0.1, 0.01),
-            (np.linspace(start=0.0, stop=100.0, num=50), 10, 1, 0.25),
+            (ONES_100, 10, 0.5, 0.5),
+            (ZEROS_100, 10, 0.6, 0.3),
+            (LINSPACE_0_100_50, 10, 0.001, 0.1),
+            (LINSPACE_0_100_50, 10, 0.1, 0.01),
+            (LINSPACE_0_100_50, 10, 1, 0.25),
         ],
     )
     def test_tanh_saturation_baselined_inverse(self, x, x0, gain, r):
@@ -447,9 +519,9 @@ class TestSaturationTransformers:
     @pytest.mark.parametrize(
         "x, b, c",
         [
-            (np.linspace(start=0.0, stop=10.0, num=50), 20, 0.5),
-            (np.linspace(start=0.0, stop=10.0, num=50), 100, 0.5),
-            (np.linspace(start=0.0, stop=10.0, num=50), 100, 1),
+            (LINSPACE_0_10_50, 20, 0.5),
+            (LINSPACE_0_10_50, 100, 0.5),
+            (LINSPACE_0_10_50, 100, 1),
         ],
     )
     def test_tanh_saturation_parameterization_transformation(self, x, b, c):
@@ -668,11 +740,11 @@ class TestTransformersComposition:
     @pytest.mark.parametrize(
         "x, alpha, lam",
         [
-            (np.ones(shape=(100)), 0.5, 1.0),
-            (np.ones(shape=(100)), 0.2, 19.0),
-            (np.zeros(shape=(100)), 0.6, 5.0),
-            (np.ones(shape=(100)), 0.99, 10.0),
-            (np.linspace(start=0.0, stop=1.0, num=50), 0.001, 0.01),
+            (ONES_100, 0.5, 1.0),
+            (ONES_100, 0.2, 19.0),
+            (ZEROS_100, 0.6, 5.0),
+            (ONES_100, 0.99, 10.0),
+            (LINSPACE_0_1_50, 0.001, 0.01),
         ],
     )
     def test_logistic_saturation_geometric_adstock_composition(self, x, alpha, lam):
@@ -691,11 +763,11 @@ class TestTransformersComposition:
     @pytest.mark.parametrize(
         "x, alpha, lam, theta, l_max",
         [
-            (np.ones(shape=(100)), 0.5, 1.0, 0, 1),
-            (np.ones(shape=(100)), 0.2, 19.0, 1, 2),
-            (np.zeros(shape=(100)), 0.6, 5.0, 3, 4),
-            (np.ones(shape=(100)), 0.99, 10.0, 0, 5),
-            (np.linspace(start=0.0, stop=1.0, num=50), 0.001, 0.01, 4, 5),
+            (ONES_100, 0.5, 1.0, 0, 1),
+            (ONES_100, 0.2, 19.0, 1, 2),
+            (ZEROS_100, 0.6, 5.0, 3, 4),
+            (ONES_100, 0.99, 10.0, 0, 5),
+            (LINSPACE_0_1_50, 0.001, 0.01, 4, 5),
         ],
     )
     def test_logistic_saturation_delayed_adstock_composition(
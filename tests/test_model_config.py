@@ -12,6 +12,7 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 
+import inspect
 import warnings
 
 import numpy as np
@@ -256,3 +257,45 @@ def test_parse_model_config_catches_errors() -> None:
     msg = "3 errors"
     with pytest.raises(ModelConfigError, match=msg):
         parse_model_config(model_config)
+
+
+def test_parse_model_config_fail_fast() -> None:
+    model_config = {
+        "alpha": "Normal",
+        "beta": {"dist": "Beta", "kwargs": {"lam": 1}},
+        "lam": {"dist": "IncorrectDistribution"},
+        "gamma": Prior("Normal"),
+    }
+
+    msg = "1 errors occurred .* Errors: Parameter alpha"
+    with pytest.raises(ModelConfigError, match=msg):
+        parse_model_config(model_config, fail_fast=True)
+
+
+def test_parse_model_config_warning_points_to_caller() -> None:
+    model_config = {
+        "alpha": {
+            "dist": "Normal",
+            "kwargs": {"mu": 0, "sigma": 1},
+        },
+    }
+
+    with pytest.warns(DeprecationWarning, match="alpha is automatically") as record:
+        lineno = inspect.currentframe().f_lineno + 1
+        parse_model_config(model_config)
+
+    assert record[0].filename == __file__
+    assert record[0].lineno == lineno
+
+
+def test_parse_model_config_errors_follow_config_order() -> None:
+    model_config = {
+        "hsgp": {"m": "wrong"},
+        "alpha": "Normal",
+    }
+
+    with pytest.raises(ModelConfigError, match="2 errors") as excinfo:
+        parse_model_config(model_config, hsgp_kwargs_fields=["hsgp"])
+
+    msg = str(excinfo.value)
+    assert msg.index("Parameter hsgp") < msg.index("Parameter alpha")